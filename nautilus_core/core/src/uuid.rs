@@ -34,9 +34,16 @@ pub struct UUID4 {
 impl UUID4 {
     #[must_use]
     pub fn new() -> Self {
-        let uuid = Uuid::new_v4();
+        Self::from_uuid(&Uuid::new_v4())
+    }
+
+    /// Encodes the hyphenated lowercase form directly into a stack buffer,
+    /// avoiding the `Display` formatting machinery of `Uuid::to_string`.
+    fn from_uuid(uuid: &Uuid) -> Self {
+        let mut buf = Uuid::encode_buffer();
+        let encoded = uuid.hyphenated().encode_lower(&mut buf);
         UUID4 {
-            value: Box::new(Rc::new(uuid.to_string())),
+            value: Box::new(Rc::new(encoded.to_owned())),
         }
     }
 }
@@ -44,9 +51,7 @@ impl UUID4 {
 impl From<&str> for UUID4 {
     fn from(s: &str) -> Self {
         let uuid = Uuid::try_parse(s).expect("invalid UUID string");
-        Self {
-            value: Box::new(Rc::new(uuid.to_string())),
-        }
+        Self::from_uuid(&uuid)
     }
 }
 
@@ -132,6 +137,12 @@ mod tests {
         assert_eq!(uuid_parsed.to_string().len(), 36);
     }
 
+    #[test]
+    fn test_uuid4_from_str_uppercase_is_normalized() {
+        let uuid = UUID4::from("6BA7B810-9DAD-11D1-80B4-00C04FD430C8");
+        assert_eq!(uuid.value.to_string(), "6ba7b810-9dad-11d1-80b4-00c04fd430c8");
+    }
+
     #[test]
     fn test_uuid4_default() {
         let uuid: UUID4 = UUID4::default();
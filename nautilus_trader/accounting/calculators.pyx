@@ -59,7 +59,7 @@ cdef class ExchangeRateCalculator:
 
         Returns
         -------
-        Decimal
+        double
 
         Raises
         ------
@@ -89,7 +89,7 @@ cdef class ExchangeRateCalculator:
         elif price_type == PriceType.MID:
             calculation_quotes = {
                 s: (bid_quotes[s] + ask_quotes[s]) / 2.0 for s in bid_quotes
-            }  # type: dict[str, Decimal]
+            }  # type: dict[str, float]
         else:
             raise ValueError(f"Cannot calculate exchange rate for PriceType."
                              f"{price_type_to_str(price_type)}")
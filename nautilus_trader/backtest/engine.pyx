@@ -885,11 +885,13 @@ cdef class BacktestEngine:
         Condition.true(start_ns < end_ns, "start was >= end")
         Condition.not_empty(self._data, "data")
 
-        # Gather clocks
-        cdef list clocks = [self.kernel.clock]
+        # Gather clocks once for the run (kernel clock last, to preserve
+        # the time event ordering of actors, then strategies, then kernel)
+        cdef list clocks = []
         cdef Actor actor
         for actor in self._kernel.trader.actors() + self._kernel.trader.strategies():
             clocks.append(actor.clock)
+        clocks.append(self.kernel.clock)
 
         # Set clocks
         cdef TestClock clock
@@ -989,20 +991,14 @@ cdef class BacktestEngine:
         cdef list all_events = []  # type: list[TimeEventHandler]
         cdef list now_events = []  # type: list[TimeEventHandler]
 
-        cdef Actor actor
-        for actor in self._kernel.trader.actors():
-            all_events += actor.clock.advance_time(now_ns, set_time=False)
-
-        cdef Strategy strategy
-        for strategy in self._kernel.trader.strategies():
-            all_events += strategy.clock.advance_time(now_ns, set_time=False)
-
-        all_events += self.kernel.clock.advance_time(now_ns, set_time=False)
+        # Clocks were gathered once per run, avoiding rebuilding the actor and
+        # strategy lists from the trader on every time advance
+        cdef TestClock clock
+        for clock in clocks:
+            all_events += clock.advance_time(now_ns, set_time=False)
 
         # Handle all events prior to the `now_ns`
-        cdef:
-            TimeEventHandler event_handler
-            TestClock clock
+        cdef TimeEventHandler event_handler
         for event_handler in sorted(all_events):
             if event_handler.event.ts_init == now_ns:
                 now_events.append(event_handler)
@@ -52,6 +52,9 @@ cdef class CacheFacade:
     cpdef list quote_ticks(self, InstrumentId instrument_id)
     cpdef list trade_ticks(self, InstrumentId instrument_id)
     cpdef list bars(self, BarType bar_type)
+    cpdef dict quote_ticks_arrays(self, InstrumentId instrument_id)
+    cpdef dict trade_ticks_arrays(self, InstrumentId instrument_id)
+    cpdef dict bars_arrays(self, BarType bar_type)
     cpdef Price price(self, InstrumentId instrument_id, PriceType price_type)
     cpdef OrderBook order_book(self, InstrumentId instrument_id)
     cpdef Ticker ticker(self, InstrumentId instrument_id, int index=*)
@@ -51,6 +51,7 @@ cdef class Cache(CacheFacade):
 
     cdef dict _general
     cdef dict _xrate_symbols
+    cdef readonly dict _xrates
     cdef dict _tickers
     cdef dict _quote_ticks
     cdef dict _trade_ticks
@@ -112,6 +113,7 @@ cdef class Cache(CacheFacade):
     cpdef void flush_db(self)
 
     cdef tuple _build_quote_table(self, Venue venue)
+    cdef void _invalidate_xrates(self, InstrumentId instrument_id)
     cdef void _build_index_venue_account(self)
     cdef void _cache_venue_account_id(self, AccountId account_id)
     cdef void _build_indexes_from_orders(self)
@@ -17,11 +17,13 @@ import copy
 import pickle
 import uuid
 from collections import deque
-from decimal import Decimal
 from typing import Optional
 
+import numpy as np
+
 from nautilus_trader.config import CacheConfig
 
+from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
@@ -57,6 +59,7 @@ from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.instruments.crypto_perpetual cimport CryptoPerpetual
 from nautilus_trader.model.instruments.currency_pair cimport CurrencyPair
 from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.trading.strategy cimport Strategy
@@ -102,6 +105,7 @@ cdef class Cache(CacheFacade):
         # Caches
         self._general = {}                     # type: dict[str, bytes]
         self._xrate_symbols = {}               # type: dict[InstrumentId, str]
+        self._xrates = {}                      # type: dict[Venue, dict[tuple, float]]
         self._tickers = {}                     # type: dict[InstrumentId, deque[Ticker]]
         self._quote_ticks = {}                 # type: dict[InstrumentId, deque[QuoteTick]]
         self._trade_ticks = {}                 # type: dict[InstrumentId, deque[TradeTick]]
@@ -677,6 +681,7 @@ cdef class Cache(CacheFacade):
 
         self._general.clear()
         self._xrate_symbols.clear()
+        self._xrates.clear()
         self._tickers.clear()
         self._quote_ticks.clear()
         self._trade_ticks.clear()
@@ -1060,6 +1065,7 @@ cdef class Cache(CacheFacade):
             self._quote_ticks[instrument_id] = ticks
 
         ticks.appendleft(tick)
+        self._invalidate_xrates(instrument_id)
 
     cpdef void add_trade_tick(self, TradeTick tick):
         """
@@ -1107,8 +1113,10 @@ cdef class Cache(CacheFacade):
         cdef PriceType price_type = <PriceType>bar._mem.bar_type.spec.price_type
         if price_type == PriceType.BID:
             self._bars_bid[bar.bar_type.instrument_id] = bar
+            self._invalidate_xrates(bar.bar_type.instrument_id)
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+            self._invalidate_xrates(bar.bar_type.instrument_id)
 
     cpdef void add_quote_ticks(self, list ticks):
         """
@@ -1121,6 +1129,7 @@ cdef class Cache(CacheFacade):
 
         """
         Condition.not_none(ticks, "ticks")
+        Condition.list_type(ticks, QuoteTick, "ticks")
 
         cdef int length = len(ticks)
         cdef InstrumentId instrument_id
@@ -1133,19 +1142,33 @@ cdef class Cache(CacheFacade):
 
         cached_ticks = self._quote_ticks.get(instrument_id)
 
+        cdef bint has_ticks = False
+        cdef uint64_t ts_last = 0
         if not cached_ticks:
             # The instrument_id was not registered
             cached_ticks = deque(maxlen=self.tick_capacity)
             self._quote_ticks[instrument_id] = cached_ticks
-        elif len(cached_ticks) > 0:
-            # Currently the simple solution for multiple consumers requesting
-            # ticks at system spool up is just to add only if the cache is empty.
-            self._log.debug("Cache already contains ticks.")
-            return
+        else:
+            # Multiple consumers may request the same ticks at system spool up,
+            # so only add ticks more recent than the latest cached tick.
+            has_ticks = True
+            ts_last = (<QuoteTick>cached_ticks[0])._mem.ts_event
 
+        cdef list to_add = ticks
         cdef QuoteTick tick
-        for tick in ticks:
-            cached_ticks.appendleft(tick)
+        if has_ticks:
+            to_add = []
+            for tick in ticks:
+                if tick._mem.ts_event > ts_last:
+                    to_add.append(tick)
+
+        if len(to_add) > self.tick_capacity:
+            # Only the most recent items fit, skip pushing the rest just to evict them
+            to_add = to_add[-self.tick_capacity:]
+
+        cached_ticks.extendleft(to_add)
+
+        self._invalidate_xrates(instrument_id)
 
     cpdef void add_trade_ticks(self, list ticks):
         """
@@ -1158,6 +1181,7 @@ cdef class Cache(CacheFacade):
 
         """
         Condition.not_none(ticks, "ticks")
+        Condition.list_type(ticks, TradeTick, "ticks")
 
         cdef int length = len(ticks)
         cdef InstrumentId instrument_id
@@ -1170,19 +1194,31 @@ cdef class Cache(CacheFacade):
 
         cached_ticks = self._trade_ticks.get(instrument_id)
 
+        cdef bint has_ticks = False
+        cdef uint64_t ts_last = 0
         if not cached_ticks:
             # The instrument_id was not registered
             cached_ticks = deque(maxlen=self.tick_capacity)
             self._trade_ticks[instrument_id] = cached_ticks
-        elif len(cached_ticks) > 0:
-            # Currently the simple solution for multiple consumers requesting
-            # ticks at system spool up is just to add only if the cache is empty.
-            self._log.debug("Cache already contains ticks.")
-            return
+        else:
+            # Multiple consumers may request the same ticks at system spool up,
+            # so only add ticks more recent than the latest cached tick.
+            has_ticks = True
+            ts_last = (<TradeTick>cached_ticks[0])._mem.ts_event
 
+        cdef list to_add = ticks
         cdef TradeTick tick
-        for tick in ticks:
-            cached_ticks.appendleft(tick)
+        if has_ticks:
+            to_add = []
+            for tick in ticks:
+                if tick._mem.ts_event > ts_last:
+                    to_add.append(tick)
+
+        if len(to_add) > self.tick_capacity:
+            # Only the most recent items fit, skip pushing the rest just to evict them
+            to_add = to_add[-self.tick_capacity:]
+
+        cached_ticks.extendleft(to_add)
 
     cpdef void add_bars(self, list bars):
         """
@@ -1195,6 +1231,7 @@ cdef class Cache(CacheFacade):
 
         """
         Condition.not_none(bars, "bars")
+        Condition.list_type(bars, Bar, "bars")
 
         cdef int length = len(bars)
         cdef BarType bar_type
@@ -1207,26 +1244,40 @@ cdef class Cache(CacheFacade):
 
         cached_bars = self._bars.get(bar_type)
 
+        cdef bint has_bars = False
+        cdef uint64_t ts_last = 0
         if not cached_bars:
             # The instrument_id was not registered
             cached_bars = deque(maxlen=self.bar_capacity)
             self._bars[bar_type] = cached_bars
-        elif len(cached_bars) > 0:
-            # Currently the simple solution for multiple consumers requesting
-            # bars at system spool up is just to add only if the cache is empty.
-            self._log.debug("Cache already contains bars.")
-            return
+        else:
+            # Multiple consumers may request the same bars at system spool up,
+            # so only add bars more recent than the latest cached bar.
+            has_bars = True
+            ts_last = (<Bar>cached_bars[0])._mem.ts_event
 
+        cdef list to_add = bars
         cdef Bar bar
-        for bar in bars:
-            cached_bars.appendleft(bar)
+        if has_bars:
+            to_add = []
+            for bar in bars:
+                if bar._mem.ts_event > ts_last:
+                    to_add.append(bar)
+
+        if len(to_add) > self.bar_capacity:
+            # Only the most recent items fit, skip pushing the rest just to evict them
+            to_add = to_add[-self.bar_capacity:]
 
-        bar = bars[-1]
+        cached_bars.extendleft(to_add)
+
+        bar = cached_bars[0]
         cdef PriceType price_type = <PriceType>bar._mem.bar_type.spec.price_type
         if price_type == PriceType.BID:
             self._bars_bid[bar.bar_type.instrument_id] = bar
+            self._invalidate_xrates(bar.bar_type.instrument_id)
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+            self._invalidate_xrates(bar.bar_type.instrument_id)
 
     cpdef void add_currency(self, Currency currency):
         """
@@ -1265,6 +1316,7 @@ cdef class Cache(CacheFacade):
             self._xrate_symbols[instrument.id] = (
                 f"{instrument.base_currency}/{instrument.quote_currency}"
             )
+            self._invalidate_xrates(instrument.id)
 
         self._log.debug(f"Added instrument {instrument.id}.")
 
@@ -1848,6 +1900,180 @@ cdef class Cache(CacheFacade):
 
         return list(self._bars.get(bar_type, []))
 
+    cpdef dict quote_ticks_arrays(self, InstrumentId instrument_id):
+        """
+        Return the quote ticks for the given instrument ID as columnar arrays.
+
+        Each column is a contiguous array in cache order (most recent first),
+        built without materializing `Price` or `Quantity` objects.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks to get.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The `bid`, `ask`, `bid_size` and `ask_size` columns as float64
+            and the `ts_event` and `ts_init` columns as uint64.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        ticks = self._quote_ticks.get(instrument_id, ())
+        cdef Py_ssize_t length = len(ticks)
+
+        bid = np.empty(length, dtype=np.float64)
+        ask = np.empty(length, dtype=np.float64)
+        bid_size = np.empty(length, dtype=np.float64)
+        ask_size = np.empty(length, dtype=np.float64)
+        ts_event = np.empty(length, dtype=np.uint64)
+        ts_init = np.empty(length, dtype=np.uint64)
+
+        cdef double[::1] bid_view = bid
+        cdef double[::1] ask_view = ask
+        cdef double[::1] bid_size_view = bid_size
+        cdef double[::1] ask_size_view = ask_size
+        cdef uint64_t[::1] ts_event_view = ts_event
+        cdef uint64_t[::1] ts_init_view = ts_init
+
+        cdef Py_ssize_t i = 0
+        cdef QuoteTick tick
+        for tick in ticks:
+            bid_view[i] = Price.raw_to_f64_c(tick._mem.bid.raw)
+            ask_view[i] = Price.raw_to_f64_c(tick._mem.ask.raw)
+            bid_size_view[i] = Quantity.raw_to_f64_c(tick._mem.bid_size.raw)
+            ask_size_view[i] = Quantity.raw_to_f64_c(tick._mem.ask_size.raw)
+            ts_event_view[i] = tick._mem.ts_event
+            ts_init_view[i] = tick._mem.ts_init
+            i += 1
+
+        return {
+            "bid": bid,
+            "ask": ask,
+            "bid_size": bid_size,
+            "ask_size": ask_size,
+            "ts_event": ts_event,
+            "ts_init": ts_init,
+        }
+
+    cpdef dict trade_ticks_arrays(self, InstrumentId instrument_id):
+        """
+        Return the trade ticks for the given instrument ID as columnar arrays.
+
+        Each column is a contiguous array in cache order (most recent first),
+        built without materializing `Price` or `Quantity` objects.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the ticks to get.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The `price` and `size` columns as float64, the `aggressor_side`
+            column as uint8 and the `ts_event` and `ts_init` columns as uint64.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        ticks = self._trade_ticks.get(instrument_id, ())
+        cdef Py_ssize_t length = len(ticks)
+
+        price = np.empty(length, dtype=np.float64)
+        size = np.empty(length, dtype=np.float64)
+        aggressor_side = np.empty(length, dtype=np.uint8)
+        ts_event = np.empty(length, dtype=np.uint64)
+        ts_init = np.empty(length, dtype=np.uint64)
+
+        cdef double[::1] price_view = price
+        cdef double[::1] size_view = size
+        cdef uint8_t[::1] aggressor_side_view = aggressor_side
+        cdef uint64_t[::1] ts_event_view = ts_event
+        cdef uint64_t[::1] ts_init_view = ts_init
+
+        cdef Py_ssize_t i = 0
+        cdef TradeTick tick
+        for tick in ticks:
+            price_view[i] = Price.raw_to_f64_c(tick._mem.price.raw)
+            size_view[i] = Quantity.raw_to_f64_c(tick._mem.size.raw)
+            aggressor_side_view[i] = <uint8_t>tick._mem.aggressor_side
+            ts_event_view[i] = tick._mem.ts_event
+            ts_init_view[i] = tick._mem.ts_init
+            i += 1
+
+        return {
+            "price": price,
+            "size": size,
+            "aggressor_side": aggressor_side,
+            "ts_event": ts_event,
+            "ts_init": ts_init,
+        }
+
+    cpdef dict bars_arrays(self, BarType bar_type):
+        """
+        Return the bars for the given bar type as columnar arrays.
+
+        Each column is a contiguous array in cache order (most recent first),
+        built without materializing `Price` or `Quantity` objects.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for bars to get.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The `open`, `high`, `low`, `close` and `volume` columns as float64
+            and the `ts_event` and `ts_init` columns as uint64.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+
+        bars = self._bars.get(bar_type, ())
+        cdef Py_ssize_t length = len(bars)
+
+        open_ = np.empty(length, dtype=np.float64)
+        high = np.empty(length, dtype=np.float64)
+        low = np.empty(length, dtype=np.float64)
+        close = np.empty(length, dtype=np.float64)
+        volume = np.empty(length, dtype=np.float64)
+        ts_event = np.empty(length, dtype=np.uint64)
+        ts_init = np.empty(length, dtype=np.uint64)
+
+        cdef double[::1] open_view = open_
+        cdef double[::1] high_view = high
+        cdef double[::1] low_view = low
+        cdef double[::1] close_view = close
+        cdef double[::1] volume_view = volume
+        cdef uint64_t[::1] ts_event_view = ts_event
+        cdef uint64_t[::1] ts_init_view = ts_init
+
+        cdef Py_ssize_t i = 0
+        cdef Bar bar
+        for bar in bars:
+            open_view[i] = Price.raw_to_f64_c(bar._mem.open.raw)
+            high_view[i] = Price.raw_to_f64_c(bar._mem.high.raw)
+            low_view[i] = Price.raw_to_f64_c(bar._mem.low.raw)
+            close_view[i] = Price.raw_to_f64_c(bar._mem.close.raw)
+            volume_view[i] = Quantity.raw_to_f64_c(bar._mem.volume.raw)
+            ts_event_view[i] = bar._mem.ts_event
+            ts_init_view[i] = bar._mem.ts_init
+            i += 1
+
+        return {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+            "ts_event": ts_event,
+            "ts_init": ts_init,
+        }
+
     cpdef Price price(self, InstrumentId instrument_id, PriceType price_type):
         """
         Return the price for the given instrument ID and price type.
@@ -1869,12 +2095,19 @@ cdef class Cache(CacheFacade):
         cdef TradeTick trade_tick
         cdef QuoteTick quote_tick
 
+        # Read the most recent tick straight from the deque head
         if price_type == PriceType.LAST:
-            trade_tick = self.trade_tick(instrument_id)
-            return trade_tick.price if trade_tick is not None else None
+            ticks = self._trade_ticks.get(instrument_id)
+            if not ticks:
+                return None
+            trade_tick = ticks[0]
+            return Price.from_raw_c(trade_tick._mem.price.raw, trade_tick._mem.price.precision)
         else:
-            quote_tick = self.quote_tick(instrument_id)
-            return quote_tick.extract_price(price_type) if quote_tick is not None else None
+            ticks = self._quote_ticks.get(instrument_id)
+            if not ticks:
+                return None
+            quote_tick = ticks[0]
+            return quote_tick.extract_price(price_type)
 
     cpdef OrderBook order_book(self, InstrumentId instrument_id):
         """
@@ -2251,27 +2484,40 @@ cdef class Cache(CacheFacade):
         Condition.not_none(to_currency, "to_currency")
 
         if from_currency == to_currency:
-            return Decimal(1)  # No conversion necessary
+            return 1.0  # No conversion necessary
+
+        cdef dict xrates = self._xrates.get(venue)
+        if xrates is None:
+            xrates = {}
+            self._xrates[venue] = xrates
+
+        cdef tuple key = (from_currency, to_currency, price_type)
+        xrate = xrates.get(key)
+        if xrate is not None:
+            return xrate  # Cached since the last price update for the venue
 
         cdef tuple quotes = self._build_quote_table(venue)
 
-        return self._xrate_calculator.get_rate(
+        cdef double rate = self._xrate_calculator.get_rate(
             from_currency=from_currency,
             to_currency=to_currency,
             price_type=price_type,
             bid_quotes=quotes[0],  # Bid
             ask_quotes=quotes[1],  # Ask
         )
+        xrates[key] = rate
+
+        return rate
 
     cdef tuple _build_quote_table(self, Venue venue):
         cdef dict bid_quotes = {}
         cdef dict ask_quotes = {}
 
+        # Prices are read from the raw struct fields (no `Price` objects built)
         cdef:
             InstrumentId instrument_id
             str base_quote
-            Price bid
-            Price ask
+            QuoteTick tick
             Bar bid_bar
             Bar ask_bar
         for instrument_id, base_quote in self._xrate_symbols.items():
@@ -2280,22 +2526,26 @@ cdef class Cache(CacheFacade):
 
             ticks = self._quote_ticks.get(instrument_id)
             if ticks:
-                bid = ticks[0].bid
-                ask = ticks[0].ask
+                tick = ticks[0]
+                bid_quotes[base_quote] = Price.raw_to_f64_c(tick._mem.bid.raw)
+                ask_quotes[base_quote] = Price.raw_to_f64_c(tick._mem.ask.raw)
             else:
                 # No quotes for instrument_id
                 bid_bar = self._bars_bid.get(instrument_id)
                 ask_bar = self._bars_ask.get(instrument_id)
                 if bid_bar is None or ask_bar is None:
                     continue # No prices for instrument_id
-                bid = bid_bar.close
-                ask = ask_bar.close
-
-            bid_quotes[base_quote] = bid.as_f64_c()
-            ask_quotes[base_quote] = ask.as_f64_c()
+                bid_quotes[base_quote] = Price.raw_to_f64_c(bid_bar._mem.close.raw)
+                ask_quotes[base_quote] = Price.raw_to_f64_c(ask_bar._mem.close.raw)
 
         return bid_quotes, ask_quotes
 
+    cdef void _invalidate_xrates(self, InstrumentId instrument_id):
+        # Drop any cached exchange rates for the venue when an xrate
+        # instrument receives a new price
+        if self._xrates and instrument_id in self._xrate_symbols:
+            self._xrates.pop(instrument_id.venue, None)
+
 # -- INSTRUMENT QUERIES ---------------------------------------------------------------------------
 
     cpdef Instrument instrument(self, InstrumentId instrument_id):
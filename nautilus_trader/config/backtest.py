@@ -14,9 +14,9 @@
 # -------------------------------------------------------------------------------------------------
 
 import hashlib
-import importlib
 import sys
 from decimal import Decimal
+from types import CodeType
 from typing import Callable, Optional, Union
 
 import msgspec
@@ -29,6 +29,7 @@ from nautilus_trader.config.common import ImportableConfig
 from nautilus_trader.config.common import NautilusConfig
 from nautilus_trader.config.common import NautilusKernelConfig
 from nautilus_trader.config.common import RiskEngineConfig
+from nautilus_trader.config.common import resolve_path
 from nautilus_trader.core.datetime import maybe_dt_to_unix_nanos
 from nautilus_trader.model.data.bar import Bar
 from nautilus_trader.model.identifiers import ClientId
@@ -77,9 +78,7 @@ class BacktestDataConfig(NautilusConfig, frozen=True):
     @property
     def data_type(self):
         if isinstance(self.data_cls, str):
-            mod_path, cls_name = self.data_cls.rsplit(":", maxsplit=1)
-            mod = importlib.import_module(mod_path)
-            return getattr(mod, cls_name)
+            return resolve_path(self.data_cls)
         else:
             return self.data_cls
 
@@ -106,12 +105,16 @@ class BacktestDataConfig(NautilusConfig, frozen=True):
     def start_time_nanos(self) -> int:
         if self.start_time is None:
             return 0
+        if type(self.start_time) is int:
+            return self.start_time  # Already UNIX nanoseconds
         return maybe_dt_to_unix_nanos(pd.Timestamp(self.start_time))
 
     @property
     def end_time_nanos(self) -> int:
         if self.end_time is None:
             return sys.maxsize
+        if type(self.end_time) is int:
+            return self.end_time  # Already UNIX nanoseconds
         return maybe_dt_to_unix_nanos(pd.Timestamp(self.end_time))
 
     def catalog(self):
@@ -230,6 +233,9 @@ class BacktestRunConfig(NautilusConfig, frozen=True):
         return tokenize_config(self.dict())
 
 
+_FILTERS_EXPR_CODE_CACHE: dict[str, CodeType] = {}
+
+
 def parse_filters_expr(s: Optional[str]):
     # TODO (bm) - could we do this better, probably requires writing our own parser?
     """
@@ -252,10 +258,13 @@ def parse_filters_expr(s: Optional[str]):
 
     def safer_eval(input_string):
         allowed_names = {"field": field}
-        code = compile(input_string, "<string>", "eval")
-        for name in code.co_names:
-            if name not in allowed_names:
-                raise NameError(f"Use of {name} not allowed")
+        code = _FILTERS_EXPR_CODE_CACHE.get(input_string)
+        if code is None:
+            code = compile(input_string, "<string>", "eval")
+            for name in code.co_names:
+                if name not in allowed_names:
+                    raise NameError(f"Use of {name} not allowed")
+            _FILTERS_EXPR_CODE_CACHE[input_string] = code
         return eval(code, {}, allowed_names)  # noqa: S307
 
     return safer_eval(s)  # Only allow use of the field object
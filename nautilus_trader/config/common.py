@@ -14,25 +14,46 @@
 # -------------------------------------------------------------------------------------------------
 
 import importlib
-import importlib.util
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import fsspec
 import msgspec
+import msgspec.structs
 
 from nautilus_trader.common import Environment
 from nautilus_trader.config.validation import PositiveInt
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+if TYPE_CHECKING:
+    from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+_IMPORT_CACHE: dict[str, Any] = {}
 
 
 def resolve_path(path: str):
-    module, cls = path.rsplit(":", maxsplit=1)
-    mod = importlib.import_module(module)
-    cls = getattr(mod, cls)
+    cls = _IMPORT_CACHE.get(path)
+    if cls is None:
+        module, sep, name = path.rpartition(":")
+        if not sep:
+            raise ValueError(f"`path` '{path}' should be of the form `path.to.module:class`")
+        cls = getattr(importlib.import_module(module), name)
+        _IMPORT_CACHE[path] = cls
     return cls
 
 
+_JSON_DECODERS: dict[type, msgspec.json.Decoder] = {}
+
+
+def json_decoder(cls: type) -> msgspec.json.Decoder:
+    decoder = _JSON_DECODERS.get(cls)
+    if decoder is None:
+        decoder = msgspec.json.Decoder(cls)
+        _JSON_DECODERS[cls] = decoder
+    return decoder
+
+
 class NautilusConfig(msgspec.Struct, kw_only=True, frozen=True):
     """
     The base class for all Nautilus configuration objects.
@@ -63,7 +84,7 @@ class NautilusConfig(msgspec.Struct, kw_only=True, frozen=True):
         dict[str, Any]
 
         """
-        return {k: getattr(self, k) for k in self.__struct_fields__}
+        return msgspec.structs.asdict(self)
 
     def json(self) -> bytes:
         """
@@ -93,7 +114,7 @@ class NautilusConfig(msgspec.Struct, kw_only=True, frozen=True):
         Any
 
         """
-        return msgspec.json.decode(raw, type=cls)
+        return json_decoder(cls).decode(raw)
 
     def validate(self) -> bool:
         """
@@ -104,7 +125,7 @@ class NautilusConfig(msgspec.Struct, kw_only=True, frozen=True):
         bool
 
         """
-        return bool(msgspec.json.decode(self.json(), type=self.__class__))
+        return bool(json_decoder(self.__class__).decode(self.json()))
 
 
 class CacheConfig(NautilusConfig, frozen=True):
@@ -293,7 +314,10 @@ class StreamingConfig(NautilusConfig, frozen=True):
     def fs(self):
         return fsspec.filesystem(protocol=self.fs_protocol, **(self.fs_storage_options or {}))
 
-    def as_catalog(self) -> ParquetDataCatalog:
+    def as_catalog(self) -> "ParquetDataCatalog":
+        # Imported lazily so loading configs does not pull in pyarrow and the catalog
+        from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
         return ParquetDataCatalog(
             path=self.catalog_path,
             fs_protocol=self.fs_protocol,
@@ -645,4 +669,4 @@ class ImportableConfig(NautilusConfig, frozen=True):
         assert ":" in self.path, "`path` variable should be of the form `path.to.module:class`"
         cls = resolve_path(self.path)
         cfg = msgspec.json.encode(self.config)
-        return msgspec.json.decode(cfg, type=cls)
+        return json_decoder(cls).decode(cfg)
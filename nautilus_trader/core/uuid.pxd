@@ -18,6 +18,7 @@ from nautilus_trader.core.rust.core cimport UUID4_t
 
 cdef class UUID4:
     cdef UUID4_t _mem
+    cdef str _value
 
     cdef str to_str(self)
 
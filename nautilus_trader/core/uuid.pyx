@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import cython
+
 from nautilus_trader.core.rust.core cimport UUID4_t
 from nautilus_trader.core.rust.core cimport uuid4_clone
 from nautilus_trader.core.rust.core cimport uuid4_eq
@@ -25,6 +27,7 @@ from nautilus_trader.core.string cimport cstr_to_pystr
 from nautilus_trader.core.string cimport pystr_to_cstr
 
 
+@cython.freelist(64)
 cdef class UUID4:
     """
     Represents a pseudo-random UUID (universally unique identifier)
@@ -61,6 +64,7 @@ cdef class UUID4:
 
     def __setstate__(self, state):
         self._mem = uuid4_from_cstr(pystr_to_cstr(state))
+        self._value = None
 
     def __eq__(self, UUID4 other) -> bool:
         return uuid4_eq(&self._mem, &other._mem)
@@ -75,7 +79,10 @@ cdef class UUID4:
         return f"{type(self).__name__}('{self}')"
 
     cdef str to_str(self):
-        return cstr_to_pystr(uuid4_to_cstr(&self._mem))
+        # The UUID is immutable, so decode the Rust string once and cache it
+        if self._value is None:
+            self._value = cstr_to_pystr(uuid4_to_cstr(&self._mem))
+        return self._value
 
     @property
     def value(self) -> str:
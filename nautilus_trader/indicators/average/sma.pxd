@@ -13,8 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 
 
 cdef class SimpleMovingAverage(MovingAverage):
-    cdef object _inputs
+    cdef double[::1] _inputs
+    cdef int _head
+
+    cpdef void update_batch(self, const double[:] values)
+    cpdef np.ndarray values_batch(self, const double[:] values)
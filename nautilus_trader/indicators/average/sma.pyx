@@ -13,12 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 import numpy as np
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.stats cimport fast_mean
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.tick cimport QuoteTick
@@ -48,7 +47,8 @@ cdef class SimpleMovingAverage(MovingAverage):
         Condition.positive_int(period, "period")
         super().__init__(period, params=[period], price_type=price_type)
 
-        self._inputs = deque(maxlen=period)
+        self._inputs = np.zeros(period, dtype=np.float64)  # Ring buffer
+        self._head = 0
         self.value = 0
 
     cpdef void handle_quote_tick(self, QuoteTick tick):
@@ -104,10 +104,69 @@ cdef class SimpleMovingAverage(MovingAverage):
             The update value.
 
         """
-        self._inputs.append(value)
+        cdef double[::1] inputs = self._inputs
+        cdef int period = self.period
+
+        inputs[self._head] = value
+        self._head += 1
+        if self._head == period:
+            self._head = 0
 
-        self.value = fast_mean(np.asarray(self._inputs, dtype=np.float64))
         self._increment_count()
 
+        # Sum the window from oldest to newest input (matches a fresh mean exactly)
+        cdef int length = self.count if self.count < period else period
+        cdef int start = self._head if self.count >= period else 0
+        cdef double total = 0.0
+        cdef int i
+        for i in range(start, length):
+            total += inputs[i]
+        for i in range(start):
+            total += inputs[i]
+
+        self.value = total / length
+
+    cpdef void update_batch(self, const double[:] values):
+        """
+        Update the indicator with the given raw values in sequence.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            The update values (float64).
+
+        """
+        cdef Py_ssize_t i
+        for i in range(values.shape[0]):
+            self.update_raw(values[i])
+
+    cpdef np.ndarray values_batch(self, const double[:] values):
+        """
+        Update the indicator with the given raw values in sequence, returning
+        the indicator value after each update.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            The update values (float64).
+
+        Returns
+        -------
+        numpy.ndarray
+            The indicator values (float64), the same length as `values`.
+
+        """
+        cdef Py_ssize_t length = values.shape[0]
+        cdef np.ndarray output = np.empty(length, dtype=np.float64)
+        cdef double[::1] output_view = output
+
+        cdef Py_ssize_t i
+        for i in range(length):
+            self.update_raw(values[i])
+            output_view[i] = self.value
+
+        return output
+
     cpdef void _reset_ma(self):
-        self._inputs.clear()
+        self._inputs[:] = 0.0
+        self._head = 0
@@ -453,8 +453,17 @@ cdef class QuoteTick(Data):
         Price
 
         """
+        cdef int64_t bid_raw
+        cdef int64_t ask_raw
         if price_type == PriceType.MID:
-            return Price.from_raw_c(((self._mem.bid.raw + self._mem.ask.raw) / 2), self._mem.bid.precision + 1)
+            # Midpoint in fixed-point integer space, floor((bid + ask) / 2),
+            # computed without overflow or a round trip through `double`
+            bid_raw = self._mem.bid.raw
+            ask_raw = self._mem.ask.raw
+            return Price.from_raw_c(
+                (bid_raw >> 1) + (ask_raw >> 1) + (bid_raw & ask_raw & 1),
+                self._mem.bid.precision + 1,
+            )
         elif price_type == PriceType.BID:
             return self.bid
         elif price_type == PriceType.ASK:
@@ -23,14 +23,14 @@ def serialize(bar: Bar):
     return data
 
 
-def deserialize(data: dict) -> Bar:
-    ignore = ("instrument_id",)
-    bar = Bar.from_dict({k: v for k, v in data.items() if k not in ignore})
-    return bar
+def deserialize(data: list[dict]) -> list[Bar]:
+    # `Bar.from_dict` only reads the bar fields, so `instrument_id` is ignored
+    return [Bar.from_dict(values) for values in data]
 
 
 register_parquet(
     Bar,
     serializer=serialize,
     deserializer=deserialize,
+    chunk=True,
 )
@@ -23,6 +23,11 @@ from nautilus_trader.serialization.base cimport _OBJECT_TO_DICT_MAP
 from nautilus_trader.serialization.base cimport Serializer
 
 
+# Reused across calls (avoids per-call encoder/decoder setup)
+cdef object _MSGPACK_ENCODER = msgpack.Encoder()
+cdef object _MSGPACK_DECODER = msgpack.Decoder()
+
+
 cdef class MsgPackSerializer(Serializer):
     """
     Provides a serializer for the `MessagePack` specification.
@@ -72,7 +77,7 @@ cdef class MsgPackSerializer(Serializer):
             if ts_init is not None:
                 obj_dict["ts_init"] = str(ts_init)
 
-        return msgpack.encode(obj_dict)
+        return _MSGPACK_ENCODER.encode(obj_dict)
 
     cpdef object deserialize(self, bytes obj_bytes):
         """
@@ -95,7 +100,7 @@ cdef class MsgPackSerializer(Serializer):
         """
         Condition.not_none(obj_bytes, "obj_bytes")
 
-        cdef dict obj_dict = msgpack.decode(obj_bytes)  # type: dict[str, Any]
+        cdef dict obj_dict = _MSGPACK_DECODER.decode(obj_bytes)  # type: dict[str, Any]
         if self.timestamps_as_str:
             ts_event = obj_dict.get("ts_event")
             if ts_event is not None:
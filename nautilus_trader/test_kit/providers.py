@@ -16,6 +16,7 @@
 import pathlib
 from datetime import date
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 
 import fsspec
@@ -506,6 +507,19 @@ class TestInstrumentProvider:
         )
 
 
+# Bounded caches of parsed CSV data keyed by URI, shared across `TestDataProvider` instances
+@lru_cache(maxsize=16)
+def _load_csv_ticks(uri: str) -> pd.DataFrame:
+    with fsspec.open(uri) as f:
+        return CSVTickDataLoader.load(file_path=f)
+
+
+@lru_cache(maxsize=16)
+def _load_csv_bars(uri: str) -> pd.DataFrame:
+    with fsspec.open(uri) as f:
+        return CSVBarDataLoader.load(file_path=f)
+
+
 class TestDataProvider:
     """
     Provides an API to load data from either the 'test/' directory or GitHub repo.
@@ -514,6 +528,12 @@ class TestDataProvider:
     ----------
     branch : str
         The NautilusTrader GitHub branch for the path.
+
+    Notes
+    -----
+    The frames parsed by `read_csv_ticks` and `read_csv_bars` are cached per URI
+    (up to 16 of each) across all instances, and each call returns a copy.
+    Use `clear_cache` to release them.
     """
 
     def __init__(self, branch="develop"):
@@ -564,13 +584,19 @@ class TestDataProvider:
 
     def read_csv_ticks(self, path: str):
         uri = self._make_uri(path=path)
-        with fsspec.open(uri) as f:
-            return CSVTickDataLoader.load(file_path=f)
+        return _load_csv_ticks(uri).copy()  # Callers may mutate the returned frame
 
     def read_csv_bars(self, path: str):
         uri = self._make_uri(path=path)
-        with fsspec.open(uri) as f:
-            return CSVBarDataLoader.load(file_path=f)
+        return _load_csv_bars(uri).copy()  # Callers may mutate the returned frame
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clear the cached frames parsed from CSV files.
+        """
+        _load_csv_ticks.cache_clear()
+        _load_csv_bars.cache_clear()
 
     def read_parquet_ticks(self, path: str, timestamp_column: str = "timestamp"):
         uri = self._make_uri(path=path)
@@ -0,0 +1,56 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.indicators.average.sma import SimpleMovingAverage
+from nautilus_trader.test_kit.performance import PerformanceHarness
+
+
+# Sawtooth 'battery' signal (charge then discharge) of 1M points
+BATTERY_SIGNAL = np.tile(
+    np.concatenate((np.linspace(0.0, 1.0, 500), np.linspace(1.0, 0.0, 500))),
+    1000,
+)
+
+
+class TestIndicatorPerformance(PerformanceHarness):
+    @pytest.mark.benchmark(group="indicators", disable_gc=True, warmup=True)
+    def test_sma_update_raw_loop(self):
+        sma = SimpleMovingAverage(10)
+        output = np.empty(len(BATTERY_SIGNAL), dtype=np.float64)  # Preallocated, no boxing
+
+        def update_loop():
+            for i, value in enumerate(BATTERY_SIGNAL):
+                sma.update_raw(value)
+                output[i] = sma.value
+
+        self.benchmark.pedantic(
+            target=update_loop,
+            iterations=1,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(group="indicators", disable_gc=True, warmup=True)
+    def test_sma_values_batch(self):
+        sma = SimpleMovingAverage(10)
+
+        self.benchmark.pedantic(
+            target=sma.values_batch,
+            args=(BATTERY_SIGNAL,),
+            iterations=1,
+            rounds=1,
+        )
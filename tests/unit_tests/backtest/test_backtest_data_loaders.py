@@ -23,6 +23,7 @@ from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Price
 from nautilus_trader.persistence.loaders import ParquetTickDataLoader
+from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from tests import TEST_DATA_DIR
 
@@ -89,3 +90,19 @@ class TestParquetTickDataLoaders:
         assert "bid" in ticks.columns
         assert ticks.iloc[0]["ask"] == 39433.62
         assert ticks.iloc[0]["bid"] == 39432.99
+
+
+class TestDataProviderCaching:
+    def test_read_csv_bars_returns_equal_independent_frames(self):
+        # Arrange
+        provider = TestDataProvider()
+
+        # Act
+        bars1 = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")
+        bars2 = TestDataProvider().read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")
+        bars1["open"] = 0.0
+
+        # Assert
+        assert bars2 is not bars1
+        assert len(bars2) == len(bars1)
+        assert (bars2["open"] != 0.0).all()
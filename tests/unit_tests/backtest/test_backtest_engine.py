@@ -15,6 +15,7 @@
 
 import tempfile
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 
 import pandas as pd
@@ -37,6 +38,7 @@ from nautilus_trader.model.data.bar import BarSpecification
 from nautilus_trader.model.data.bar import BarType
 from nautilus_trader.model.data.base import DataType
 from nautilus_trader.model.data.base import GenericData
+from nautilus_trader.model.data.tick import QuoteTick
 from nautilus_trader.model.data.venue import InstrumentStatusUpdate
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import AggregationSource
@@ -75,6 +77,16 @@ GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
+@lru_cache(1)
+def usdjpy_quote_ticks() -> list[QuoteTick]:
+    # Wrangled on first use and shared read-only (`BacktestEngine.add_data` copies the list)
+    provider = TestDataProvider()
+    return QuoteTickDataWrangler(USDJPY_SIM).process_bar_data(
+        bid_data=provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")[:2000],
+        ask_data=provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")[:2000],
+    )
+
+
 class TestBacktestEngine:
     def setup(self):
         # Fixture Setup
@@ -95,14 +107,8 @@ class TestBacktestEngine:
         )
 
         # Setup data
-        wrangler = QuoteTickDataWrangler(self.usdjpy)
-        provider = TestDataProvider()
-        ticks = wrangler.process_bar_data(
-            bid_data=provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")[:2000],
-            ask_data=provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")[:2000],
-        )
         engine.add_instrument(USDJPY_SIM)
-        engine.add_data(ticks)
+        engine.add_data(usdjpy_quote_ticks())
         return engine
 
     def teardown(self):
@@ -13,18 +13,22 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from decimal import Decimal
-
+import numpy as np
 import pytest
 
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.config import CacheConfig
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data.bar import Bar
 from nautilus_trader.model.data.bar import BarType
 from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
@@ -35,16 +39,79 @@ from nautilus_trader.test_kit.stubs.component import TestComponentStubs
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
+# No test inspects log output (the logger bypasses), so share a single instance
+LOGGER = TestComponentStubs.logger()
+
 SIM = Venue("SIM")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+GBPUSD_1SEC_MID = TestDataStubs.bartype_gbpusd_1sec_mid()
+
+# Prices and quantities are immutable, so share them across tests
+ZERO_PRICE = Price.from_str("0")
+AUDUSD_BID = Price.from_str("0.80000")
+AUDUSD_ASK = Price.from_str("0.80010")
+AUDUSD_NEW_BID = Price.from_str("0.90000")
+AUDUSD_NEW_ASK = Price.from_str("0.90010")
+ONE_QTY = Quantity.from_int(1)
+AUDUSD_1MIN_BID = TestDataStubs.bartype_audusd_1min_bid()
+
+
+def make_quote_tick(ts: int) -> QuoteTick:
+    return QuoteTick(
+        instrument_id=AUDUSD_SIM.id,
+        bid=AUDUSD_BID,
+        ask=AUDUSD_ASK,
+        bid_size=ONE_QTY,
+        ask_size=ONE_QTY,
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+
+def make_trade_tick(ts: int) -> TradeTick:
+    return TradeTick(
+        instrument_id=AUDUSD_SIM.id,
+        price=AUDUSD_BID,
+        size=ONE_QTY,
+        aggressor_side=AggressorSide.BUYER,
+        trade_id=TradeId(str(ts)),
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+
+def make_daily_bar(price_type: str, price: Price, ts: int) -> Bar:
+    return Bar(
+        bar_type=BarType.from_str(f"{AUDUSD_SIM.id}-1-DAY-{price_type}-EXTERNAL"),
+        open=price,
+        high=price,
+        low=price,
+        close=price,
+        volume=ONE_QTY,
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+
+def make_bar(ts: int) -> Bar:
+    return Bar(
+        bar_type=AUDUSD_1MIN_BID,
+        open=AUDUSD_BID,
+        high=AUDUSD_ASK,
+        low=AUDUSD_BID,
+        close=AUDUSD_ASK,
+        volume=ONE_QTY,
+        ts_event=ts,
+        ts_init=ts,
+    )
 
 
 class TestCache:
     def setup(self):
         # Fixture Setup
-        self.cache = TestComponentStubs.cache()
+        self.cache = TestComponentStubs.cache(logger=LOGGER)
 
     def test_reset_an_empty_cache(self):
         # Arrange, Act
@@ -54,87 +121,40 @@ class TestCache:
         assert self.cache.instruments() == []
         assert self.cache.quote_ticks(AUDUSD_SIM.id) == []
         assert self.cache.trade_ticks(AUDUSD_SIM.id) == []
-        assert self.cache.bars(TestDataStubs.bartype_gbpusd_1sec_mid()) == []
-
-    def test_instrument_ids_when_no_instruments_returns_empty_list(self):
-        # Arrange, Act, Assert
-        assert self.cache.instrument_ids() == []
-
-    def test_instruments_when_no_instruments_returns_empty_list(self):
-        # Arrange, Act, Assert
-        assert self.cache.instruments() == []
-
-    def test_tickers_for_unknown_instrument_returns_empty_list(self):
-        # Arrange, Act, Assert
-        assert self.cache.tickers(AUDUSD_SIM.id) == []
-
-    def test_quote_ticks_for_unknown_instrument_returns_empty_list(self):
-        # Arrange, Act, Assert
-        assert self.cache.quote_ticks(AUDUSD_SIM.id) == []
-
-    def test_trade_ticks_for_unknown_instrument_returns_empty_list(self):
-        # Arrange, Act, Assert
-        assert self.cache.trade_ticks(AUDUSD_SIM.id) == []
-
-    def test_bars_for_unknown_bar_type_returns_empty_list(self):
-        # Arrange, Act, Assert
-        assert self.cache.bars(TestDataStubs.bartype_gbpusd_1sec_mid()) == []
-
-    def test_instrument_when_no_instruments_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.cache.instrument(AUDUSD_SIM.id) is None
-
-    def test_order_book_for_unknown_instrument_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.cache.order_book(AUDUSD_SIM.id) is None
-
-    def test_ticker_when_no_tickers_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.cache.ticker(AUDUSD_SIM.id) is None
-
-    def test_quote_tick_when_no_ticks_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.cache.quote_tick(AUDUSD_SIM.id) is None
-
-    def test_trade_tick_when_no_ticks_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.cache.trade_tick(AUDUSD_SIM.id) is None
+        assert self.cache.bars(GBPUSD_1SEC_MID) == []
 
-    def test_bar_when_no_bars_returns_none(self):
-        # Arrange, Act, Assert
-        assert self.cache.bar(TestDataStubs.bartype_gbpusd_1sec_mid()) is None
-
-    def test_ticker_count_for_unknown_instrument_returns_zero(self):
-        # Arrange, Act, Assert
-        assert self.cache.ticker_count(AUDUSD_SIM.id) == 0
-
-    def test_quote_tick_count_for_unknown_instrument_returns_zero(self):
-        # Arrange, Act, Assert
-        assert self.cache.quote_tick_count(AUDUSD_SIM.id) == 0
-
-    def test_trade_tick_count_for_unknown_instrument_returns_zero(self):
-        # Arrange, Act, Assert
-        assert self.cache.trade_tick_count(AUDUSD_SIM.id) == 0
-
-    def test_has_order_book_for_unknown_instrument_returns_false(self):
-        # Arrange, Act, Assert
-        assert not self.cache.has_order_book(AUDUSD_SIM.id)
-
-    def test_has_tickers_for_unknown_instrument_returns_false(self):
-        # Arrange, Act, Assert
-        assert not self.cache.has_tickers(AUDUSD_SIM.id)
-
-    def test_has_quote_ticks_for_unknown_instrument_returns_false(self):
-        # Arrange, Act, Assert
-        assert not self.cache.has_quote_ticks(AUDUSD_SIM.id)
-
-    def test_has_trade_ticks_for_unknown_instrument_returns_false(self):
-        # Arrange, Act, Assert
-        assert not self.cache.has_trade_ticks(AUDUSD_SIM.id)
+    @pytest.mark.parametrize(
+        "method, args, expected",
+        [
+            ["instrument_ids", (), []],
+            ["instruments", (), []],
+            ["tickers", (AUDUSD_SIM.id,), []],
+            ["quote_ticks", (AUDUSD_SIM.id,), []],
+            ["trade_ticks", (AUDUSD_SIM.id,), []],
+            ["bars", (GBPUSD_1SEC_MID,), []],
+            ["instrument", (AUDUSD_SIM.id,), None],
+            ["order_book", (AUDUSD_SIM.id,), None],
+            ["ticker", (AUDUSD_SIM.id,), None],
+            ["quote_tick", (AUDUSD_SIM.id,), None],
+            ["trade_tick", (AUDUSD_SIM.id,), None],
+            ["bar", (GBPUSD_1SEC_MID,), None],
+            ["ticker_count", (AUDUSD_SIM.id,), 0],
+            ["quote_tick_count", (AUDUSD_SIM.id,), 0],
+            ["trade_tick_count", (AUDUSD_SIM.id,), 0],
+            ["has_order_book", (AUDUSD_SIM.id,), False],
+            ["has_tickers", (AUDUSD_SIM.id,), False],
+            ["has_quote_ticks", (AUDUSD_SIM.id,), False],
+            ["has_trade_ticks", (AUDUSD_SIM.id,), False],
+            ["has_bars", (GBPUSD_1SEC_MID,), False],
+        ],
+    )
+    def test_queries_for_unknown_data_return_empty_defaults(self, method, args, expected):
+        # Arrange, Act
+        result = getattr(self.cache, method)(*args)
 
-    def test_has_bars_for_unknown_bar_type_returns_false(self):
-        # Arrange, Act, Assert
-        assert not self.cache.has_bars(TestDataStubs.bartype_gbpusd_1sec_mid())
+        # Assert
+        assert result == expected
+        assert type(result) is type(expected)
 
     def test_instrument_ids_when_one_instrument_returns_expected_list(self):
         # Arrange
@@ -208,80 +228,154 @@ class TestCache:
         # Assert
         assert result == []
 
-    def test_quote_ticks_when_one_tick_returns_expected_list(self):
+    @pytest.mark.parametrize(
+        "make_data, add_one, add_many, read_all, read_count, key",
+        [
+            [
+                make_quote_tick,
+                "add_quote_tick",
+                "add_quote_ticks",
+                "quote_ticks",
+                "quote_tick_count",
+                AUDUSD_SIM.id,
+            ],
+            [
+                make_trade_tick,
+                "add_trade_tick",
+                "add_trade_ticks",
+                "trade_ticks",
+                "trade_tick_count",
+                AUDUSD_SIM.id,
+            ],
+            [make_bar, "add_bar", "add_bars", "bars", "bar_count", AUDUSD_1MIN_BID],
+        ],
+    )
+    def test_add_many_then_read_back_does_not_duplicate(
+        self,
+        make_data,
+        add_one,
+        add_many,
+        read_all,
+        read_count,
+        key,
+    ):
         # Arrange
-        tick = TestDataStubs.quote_tick_5decimal()
+        data = [make_data(ts) for ts in range(100)]
 
-        self.cache.add_quote_ticks([tick])
+        getattr(self.cache, add_one)(data[0])
 
         # Act
-        result = self.cache.quote_ticks(tick.instrument_id)
+        getattr(self.cache, add_many)(data)
+        getattr(self.cache, add_many)(data)  # Already cached
 
         # Assert
-        assert result == [tick]
+        assert getattr(self.cache, read_count)(key) == 100
+        assert getattr(self.cache, read_all)(key) == data[::-1]
 
-    def test_add_quote_ticks_when_already_ticks_does_not_add(self):
+    def test_add_quote_ticks_beyond_capacity_keeps_most_recent(self):
         # Arrange
-        tick = TestDataStubs.quote_tick_5decimal()
-
-        self.cache.add_quote_tick(tick)
+        cache = Cache(logger=LOGGER, config=CacheConfig(tick_capacity=10))
+        ticks = [make_quote_tick(ts) for ts in range(25)]
 
         # Act
-        self.cache.add_quote_ticks([tick])
-        result = self.cache.quote_ticks(tick.instrument_id)
+        cache.add_quote_ticks(ticks)
 
         # Assert
-        assert result == [tick]
+        assert cache.quote_tick_count(AUDUSD_SIM.id) == 10
+        assert cache.quote_ticks(AUDUSD_SIM.id) == ticks[:-11:-1]
 
-    def test_trade_ticks_when_one_tick_returns_expected_list(self):
+    def test_add_quote_ticks_when_already_ticks_adds_only_more_recent(self):
         # Arrange
-        tick = TestDataStubs.trade_tick_5decimal()
+        tick1 = TestDataStubs.quote_tick_5decimal()
+        tick2 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("1.00002"),
+            ask=Price.from_str("1.00004"),
+            bid_size=ONE_QTY,
+            ask_size=ONE_QTY,
+            ts_event=1,
+            ts_init=1,
+        )
 
-        self.cache.add_trade_ticks([tick])
+        self.cache.add_quote_tick(tick1)
 
         # Act
-        result = self.cache.trade_ticks(tick.instrument_id)
+        self.cache.add_quote_ticks([tick1, tick2])
+        result = self.cache.quote_ticks(AUDUSD_SIM.id)
 
         # Assert
-        assert result == [tick]
+        assert result == [tick2, tick1]
 
-    def test_add_trade_ticks_when_already_ticks_does_not_add(self):
+    def test_quote_ticks_arrays_for_unknown_instrument_returns_empty_arrays(self):
+        # Arrange, Act
+        result = self.cache.quote_ticks_arrays(AUDUSD_SIM.id)
+
+        # Assert
+        assert list(result) == ["bid", "ask", "bid_size", "ask_size", "ts_event", "ts_init"]
+        assert all(len(column) == 0 for column in result.values())
+
+    def test_quote_ticks_arrays_returns_columns_in_cache_order(self):
         # Arrange
-        tick = TestDataStubs.trade_tick_5decimal()
+        tick1 = TestDataStubs.quote_tick_5decimal()
+        tick2 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("1.00003"),
+            ask=Price.from_str("1.00004"),
+            bid_size=Quantity.from_int(2),
+            ask_size=Quantity.from_int(3),
+            ts_event=1,
+            ts_init=2,
+        )
 
-        self.cache.add_trade_tick(tick)
+        self.cache.add_quote_tick(tick1)
+        self.cache.add_quote_tick(tick2)
 
         # Act
-        self.cache.add_trade_ticks([tick])
-        result = self.cache.trade_ticks(tick.instrument_id)
+        result = self.cache.quote_ticks_arrays(AUDUSD_SIM.id)
 
         # Assert
-        assert result == [tick]
+        assert result["bid"].dtype == np.float64
+        assert result["ts_event"].dtype == np.uint64
+        assert result["bid"].tolist() == [1.00003, tick1.bid.as_double()]
+        assert result["ask"].tolist() == [1.00004, tick1.ask.as_double()]
+        assert result["bid_size"].tolist() == [2.0, tick1.bid_size.as_double()]
+        assert result["ask_size"].tolist() == [3.0, tick1.ask_size.as_double()]
+        assert result["ts_event"].tolist() == [1, tick1.ts_event]
+        assert result["ts_init"].tolist() == [2, tick1.ts_init]
 
-    def test_bars_when_one_bar_returns_expected_list(self):
+    def test_trade_ticks_arrays_returns_expected_columns(self):
         # Arrange
-        bar = TestDataStubs.bar_5decimal()
+        tick = TestDataStubs.trade_tick_5decimal()
 
-        self.cache.add_bars([bar])
+        self.cache.add_trade_tick(tick)
 
         # Act
-        result = self.cache.bars(bar.bar_type)
+        result = self.cache.trade_ticks_arrays(tick.instrument_id)
 
         # Assert
-        assert result == [bar]
+        assert result["price"].tolist() == [tick.price.as_double()]
+        assert result["size"].tolist() == [tick.size.as_double()]
+        assert result["aggressor_side"].tolist() == [tick.aggressor_side]
+        assert result["ts_event"].tolist() == [tick.ts_event]
+        assert result["ts_init"].tolist() == [tick.ts_init]
 
-    def test_add_bars_when_already_bars_does_not_add(self):
+    def test_bars_arrays_returns_expected_columns(self):
         # Arrange
         bar = TestDataStubs.bar_5decimal()
 
         self.cache.add_bar(bar)
 
         # Act
-        self.cache.add_bars([bar])
-        result = self.cache.bars(bar.bar_type)
+        result = self.cache.bars_arrays(bar.bar_type)
 
         # Assert
-        assert result == [bar]
+        assert result["open"].tolist() == [bar.open.as_double()]
+        assert result["high"].tolist() == [bar.high.as_double()]
+        assert result["low"].tolist() == [bar.low.as_double()]
+        assert result["close"].tolist() == [bar.close.as_double()]
+        assert result["volume"].tolist() == [bar.volume.as_double()]
+        assert result["ts_event"].tolist() == [bar.ts_event]
+        assert result["ts_init"].tolist() == [bar.ts_init]
 
     def test_instrument_when_no_instrument_returns_none(self):
         # Arrange, Act
@@ -463,7 +557,7 @@ class TestCache:
 
     def test_bar_with_two_bars_returns_expected_bar(self):
         # Arrange
-        bar_type = TestDataStubs.bartype_audusd_1min_bid()
+        bar_type = AUDUSD_1MIN_BID
         bar1 = TestDataStubs.bar_5decimal()
         bar2 = TestDataStubs.bar_5decimal()
 
@@ -503,8 +597,8 @@ class TestCache:
             instrument_id=USDJPY_SIM.id,
             bid=Price.from_str("110.80000"),
             ask=Price.from_str("110.80010"),
-            bid_size=Quantity.from_int(1),
-            ask_size=Quantity.from_int(1),
+            bid_size=ONE_QTY,
+            ask_size=ONE_QTY,
             ts_event=0,
             ts_init=0,
         )
@@ -522,7 +616,7 @@ class TestCache:
         result = self.cache.get_xrate(SIM, AUD, AUD)
 
         # Assert
-        assert result == Decimal("1")
+        assert result == 1.0
 
     def test_get_xrate_with_conversion(self):
         # Arrange
@@ -530,10 +624,10 @@ class TestCache:
 
         tick = QuoteTick(
             instrument_id=AUDUSD_SIM.id,
-            bid=Price.from_str("0.80000"),
-            ask=Price.from_str("0.80010"),
-            bid_size=Quantity.from_int(1),
-            ask_size=Quantity.from_int(1),
+            bid=AUDUSD_BID,
+            ask=AUDUSD_ASK,
+            bid_size=ONE_QTY,
+            ask_size=ONE_QTY,
             ts_event=0,
             ts_init=0,
         )
@@ -546,31 +640,173 @@ class TestCache:
         # Assert
         assert result == 0.80005
 
+    def test_get_xrate_when_no_update_returns_cached_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(make_quote_tick(ts=0))
+
+        result1 = self.cache.get_xrate(SIM, AUD, USD)
+        key = (AUD, USD, PriceType.MID)
+        cached = dict(self.cache._xrates[SIM])
+
+        # Replace the cached rate, a rebuild of the quote table would not return it
+        self.cache._xrates[SIM][key] = 0.5
+
+        # Act
+        result2 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result1 == 0.80005
+        assert cached == {key: 0.80005}
+        assert result2 == 0.5
+        assert self.cache._xrates == {SIM: {key: 0.5}}
+
+    def test_get_xrate_when_quote_updated_returns_new_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+
+        tick1 = TestDataStubs.quote_tick_5decimal(
+            instrument_id=AUDUSD_SIM.id,
+            bid=AUDUSD_BID,
+            ask=AUDUSD_ASK,
+        )
+        tick2 = TestDataStubs.quote_tick_5decimal(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("0.90000"),
+            ask=Price.from_str("0.90010"),
+        )
+
+        self.cache.add_quote_tick(tick1)
+        result1 = self.cache.get_xrate(SIM, AUD, USD)  # Warms the xrate cache
+
+        # Act
+        self.cache.add_quote_tick(tick2)
+        result2 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result1 == 0.80005
+        assert result2 == 0.90005
+
+    def test_get_xrate_when_quote_ticks_added_returns_new_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+
+        tick1 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=AUDUSD_BID,
+            ask=AUDUSD_ASK,
+            bid_size=ONE_QTY,
+            ask_size=ONE_QTY,
+            ts_event=0,
+            ts_init=0,
+        )
+        tick2 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=AUDUSD_NEW_BID,
+            ask=AUDUSD_NEW_ASK,
+            bid_size=ONE_QTY,
+            ask_size=ONE_QTY,
+            ts_event=1,
+            ts_init=1,
+        )
+
+        self.cache.add_quote_ticks([tick1])
+        result1 = self.cache.get_xrate(SIM, AUD, USD)  # Warms the xrate cache
+
+        # Act
+        self.cache.add_quote_ticks([tick2])
+        result2 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result1 == 0.80005
+        assert result2 == 0.90005
+
+    def test_get_xrate_when_bar_updated_with_no_quotes_returns_new_rate(self):
+        # Arrange
+        self.cache.reset()
+        self.cache.add_instrument(AUDUSD_SIM)
+
+        self.cache.add_bar(make_daily_bar("BID", AUDUSD_BID, ts=0))
+        self.cache.add_bar(make_daily_bar("ASK", AUDUSD_ASK, ts=0))
+        result1 = self.cache.get_xrate(SIM, AUD, USD)  # Warms the xrate cache
+
+        # Act
+        self.cache.add_bar(make_daily_bar("BID", AUDUSD_NEW_BID, ts=1))
+        self.cache.add_bar(make_daily_bar("ASK", AUDUSD_NEW_ASK, ts=1))
+        result2 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result1 == 0.80005
+        assert result2 == 0.90005
+
+    def test_get_xrate_when_bars_added_with_no_quotes_returns_new_rate(self):
+        # Arrange
+        self.cache.reset()
+        self.cache.add_instrument(AUDUSD_SIM)
+
+        self.cache.add_bars([make_daily_bar("BID", AUDUSD_BID, ts=0)])
+        self.cache.add_bars([make_daily_bar("ASK", AUDUSD_ASK, ts=0)])
+        result1 = self.cache.get_xrate(SIM, AUD, USD)  # Warms the xrate cache
+
+        # Act
+        self.cache.add_bars([make_daily_bar("BID", AUDUSD_NEW_BID, ts=1)])
+        self.cache.add_bars([make_daily_bar("ASK", AUDUSD_NEW_ASK, ts=1)])
+        result2 = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result1 == 0.80005
+        assert result2 == 0.90005
+
+    def test_get_xrate_when_instrument_added_for_venue_returns_new_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(make_quote_tick(ts=0))
+
+        # Quotes for an instrument not yet added are not part of the quote table
+        self.cache.add_quote_tick(
+            QuoteTick(
+                instrument_id=USDJPY_SIM.id,
+                bid=Price.from_str("110.80000"),
+                ask=Price.from_str("110.80010"),
+                bid_size=ONE_QTY,
+                ask_size=ONE_QTY,
+                ts_event=0,
+                ts_init=0,
+            ),
+        )
+        result1 = self.cache.get_xrate(SIM, JPY, USD)  # Warms the xrate cache
+
+        # Act
+        self.cache.add_instrument(USDJPY_SIM)
+        result2 = self.cache.get_xrate(SIM, JPY, USD)
+
+        # Assert
+        assert result1 == 0.0
+        assert result2 == 0.009025266685348969
+
     def test_get_xrate_fallbacks_to_bars_if_no_quotes_returns_correct_rate(self):
         # Arrange
         self.cache.reset()
         self.cache.add_instrument(AUDUSD_SIM)
 
-        bid_price = Price.from_str("0.80000")
         bid_bar = Bar(
             bar_type=BarType.from_str(f"{AUDUSD_SIM.id}-1-DAY-BID-EXTERNAL"),
-            open=bid_price,
-            high=bid_price,
-            low=bid_price,
-            close=bid_price,
-            volume=Quantity.from_int(1),
+            open=AUDUSD_BID,
+            high=AUDUSD_BID,
+            low=AUDUSD_BID,
+            close=AUDUSD_BID,
+            volume=ONE_QTY,
             ts_event=0,
             ts_init=0,
         )
 
-        ask_price = Price.from_str("0.80010")
         ask_bar = Bar(
             bar_type=BarType.from_str(f"{AUDUSD_SIM.id}-1-DAY-ASK-EXTERNAL"),
-            open=ask_price,
-            high=ask_price,
-            low=ask_price,
-            close=ask_price,
-            volume=Quantity.from_int(1),
+            open=AUDUSD_ASK,
+            high=AUDUSD_ASK,
+            low=AUDUSD_ASK,
+            close=AUDUSD_ASK,
+            volume=ONE_QTY,
             ts_event=0,
             ts_init=0,
         )
@@ -588,47 +824,45 @@ class TestCache:
         # Arrange
         self.cache.reset()
         self.cache.add_instrument(AUDUSD_SIM)
-        bid_price = Price.from_str("0.80000")
-        ask_price = Price.from_str("0.80010")
 
         bid_bar1 = Bar(
             bar_type=BarType.from_str(f"{AUDUSD_SIM.id}-1-DAY-BID-EXTERNAL"),
-            open=bid_price,
-            high=bid_price,
-            low=bid_price,
-            close=bid_price,
-            volume=Quantity.from_int(1),
+            open=AUDUSD_BID,
+            high=AUDUSD_BID,
+            low=AUDUSD_BID,
+            close=AUDUSD_BID,
+            volume=ONE_QTY,
             ts_event=0,
             ts_init=0,
         )
         bid_bar2 = Bar(
             bar_type=BarType.from_str(f"{AUDUSD_SIM.id}-1-DAY-BID-EXTERNAL"),
-            open=Price.from_str("0"),
-            high=Price.from_str("0"),
-            low=Price.from_str("0"),
-            close=Price.from_str("0"),
-            volume=Quantity.from_int(1),
+            open=ZERO_PRICE,
+            high=ZERO_PRICE,
+            low=ZERO_PRICE,
+            close=ZERO_PRICE,
+            volume=ONE_QTY,
             ts_event=0,
             ts_init=0,
         )
 
         ask_bar1 = Bar(
             bar_type=BarType.from_str(f"{AUDUSD_SIM.id}-1-DAY-ASK-EXTERNAL"),
-            open=ask_price,
-            high=ask_price,
-            low=ask_price,
-            close=ask_price,
-            volume=Quantity.from_int(1),
+            open=AUDUSD_ASK,
+            high=AUDUSD_ASK,
+            low=AUDUSD_ASK,
+            close=AUDUSD_ASK,
+            volume=ONE_QTY,
             ts_event=0,
             ts_init=0,
         )
         ask_bar2 = Bar(
             bar_type=BarType.from_str(f"{AUDUSD_SIM.id}-1-DAY-ASK-EXTERNAL"),
-            open=Price.from_str("0"),
-            high=Price.from_str("0"),
-            low=Price.from_str("0"),
-            close=Price.from_str("0"),
-            volume=Quantity.from_int(1),
+            open=ZERO_PRICE,
+            high=ZERO_PRICE,
+            low=ZERO_PRICE,
+            close=ZERO_PRICE,
+            volume=ONE_QTY,
             ts_event=0,
             ts_init=0,
         )
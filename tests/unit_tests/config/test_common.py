@@ -14,8 +14,13 @@
 # -------------------------------------------------------------------------------------------------
 
 import msgspec.json
+import pytest
 
+from nautilus_trader.adapters.binance.config import BinanceDataClientConfig
 from nautilus_trader.config import ImportableConfig
+from nautilus_trader.config.common import _IMPORT_CACHE
+from nautilus_trader.config.common import json_decoder
+from nautilus_trader.config.common import resolve_path
 
 
 class TestConfigCommon:
@@ -35,3 +40,34 @@ class TestConfigCommon:
 
         # Assert
         assert config.api_key == "abc"
+
+    def test_resolve_path_caches_resolved_object(self):
+        # Arrange
+        path = "nautilus_trader.adapters.binance.config:BinanceDataClientConfig"
+
+        # Act
+        result1 = resolve_path(path)
+        result2 = resolve_path(path)
+
+        # Assert
+        assert result1 is BinanceDataClientConfig
+        assert result2 is result1
+        assert _IMPORT_CACHE[path] is BinanceDataClientConfig
+
+    def test_json_decoder_is_reused_per_type(self):
+        # Arrange
+        raw = msgspec.json.encode({"path": "a.b:C", "config": {}})
+
+        # Act
+        decoder1 = json_decoder(ImportableConfig)
+        decoder2 = json_decoder(ImportableConfig)
+        config = ImportableConfig.parse(raw)
+
+        # Assert
+        assert decoder2 is decoder1
+        assert config == ImportableConfig(path="a.b:C", config={})
+
+    def test_resolve_path_without_separator_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            resolve_path("nautilus_trader.adapters.binance.config.BinanceDataClientConfig")
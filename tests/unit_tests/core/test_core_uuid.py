@@ -54,3 +54,15 @@ class TestUUID:
         assert isinstance(result, UUID4)
         assert len(str(result)) == 36
         assert len(str(result).replace("-", "")) == 32
+
+    def test_value_is_decoded_once(self):
+        # Arrange
+        uuid = UUID4("c2988650-5beb-8af8-e714-377a3a1c26ed")
+
+        # Act
+        value1 = uuid.value
+        value2 = str(uuid)
+
+        # Assert
+        assert value1 == "c2988650-5beb-8af8-e714-377a3a1c26ed"
+        assert value2 is value1
@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pytest
+
 from nautilus_trader.indicators.average.sma import SimpleMovingAverage
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -160,6 +163,57 @@ class TestSimpleMovingAverage:
         assert sma_for_ticks.has_inputs
         assert sma_for_ticks.value == 1.00001
 
+    def test_value_with_more_inputs_than_period_returns_mean_of_window(self):
+        # Arrange
+        for i in range(1, 26):
+            self.sma.update_raw(float(i))
+
+        # Act, Assert
+        assert self.sma.count == 25
+        assert self.sma.value == 20.5  # Mean of 16..25
+
+    def test_update_batch_matches_update_loop(self):
+        # Arrange
+        values = np.random.default_rng(42).random(1000)
+        sma_loop = SimpleMovingAverage(10)
+
+        # Act
+        for value in values:
+            sma_loop.update_raw(value)
+        self.sma.update_batch(values)
+
+        # Assert
+        assert self.sma.count == sma_loop.count == 1000
+        assert self.sma.value == sma_loop.value
+        assert self.sma.value == pytest.approx(np.mean(values[-10:]))
+
+    def test_values_batch_returns_value_after_each_update(self):
+        # Arrange
+        values = np.arange(1.0, 26.0)
+
+        # Act
+        result = self.sma.values_batch(values)
+
+        # Assert
+        assert len(result) == len(values)
+        assert result[0] == 1.0
+        assert result[9] == 5.5
+        assert result[-1] == self.sma.value == 20.5
+
+    def test_batch_methods_accept_read_only_arrays(self):
+        # Arrange
+        values = np.arange(1.0, 26.0)
+        values.flags.writeable = False
+        sma_batch = SimpleMovingAverage(10)
+
+        # Act
+        result = self.sma.values_batch(values)
+        sma_batch.update_batch(values)
+
+        # Assert
+        assert result[-1] == self.sma.value == 20.5
+        assert sma_batch.value == 20.5
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
@@ -24,6 +24,7 @@ from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.events.risk import TradingStateChanged
 from nautilus_trader.common.events.system import ComponentStateChanged
 from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.data.bar import Bar
 from nautilus_trader.model.enums import BookAction
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import OrderSide
@@ -135,6 +136,23 @@ class TestParquetSerializer:
         bar = TestDataStubs.bar_5decimal()
         self._test_serialization(obj=bar)
 
+    def test_serialize_and_deserialize_bars_chunk(self):
+        # Arrange
+        bar1 = TestDataStubs.bar_5decimal()
+        bar2 = TestDataStubs.bar_3decimal()
+        serialized = [ParquetSerializer.serialize(bar) for bar in (bar1, bar2, bar1)]
+
+        # Act
+        deserialized = ParquetSerializer.deserialize(cls=Bar, chunk=serialized)
+
+        # Assert
+        assert deserialized == [bar1, bar2, bar1]
+        assert [bar.bar_type for bar in deserialized] == [
+            bar1.bar_type,
+            bar2.bar_type,
+            bar1.bar_type,
+        ]
+
     def test_serialize_and_deserialize_order_book_delta(self):
         delta = OrderBookDelta(
             instrument_id=TestIdStubs.audusd_id(),